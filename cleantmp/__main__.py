@@ -13,12 +13,17 @@ Versión: v1.1
 Licencia: MIT
 """
 import argparse
-import fnmatch
 import os
 import signal
 import sys
+import threading
+from collections import deque
 from types import FrameType
-from typing import Optional
+from typing import Iterator, Optional
+
+# fnmatch/re, sqlite3, concurrent.futures y hyperscan se importan de forma
+# diferida donde se usan: ninguno hace falta para -v/-h ni para los errores
+# de arranque, y juntos suman una parte apreciable del tiempo de importación.
 
 
 colors = {
@@ -30,6 +35,10 @@ colors = {
     'reset': '\033[0;37m',
 }
 
+# Prefijo con los colores ya interpolados; se construye una sola vez para no
+# repetir búsquedas en el diccionario y formateos dentro del bucle caliente.
+_MSG_DELETE_ERROR = f"{colors['error']}[!] No se ha podido eliminar el archivo:{colors['reset']} "
+
 
 stats = {
     "examined_files": 0,
@@ -40,27 +49,82 @@ stats = {
     "ignored_dirs": 0
 }
 
-TEMP_FILES = [
-    ".DS_Store",
-    "Thumbs.db",
-    "ehthumbs.db",
-    "Desktop.ini"
-    ]
+# Protege stats cuando varias carpetas se procesan en paralelo.
+_stats_lock = threading.Lock()
+
+# Número máximo de hilos del pool; la carga es de E/S (getdents/unlink),
+# por lo que más hilos no aportan a partir de este punto.
+MAX_WORKERS = 8
+
+# Con este número de subcarpetas o menos se procesa en el mismo hilo:
+# encolar en el pool cuesta más de lo que se gana.
+_FANOUT_THRESHOLD = 4
+
+# Si el sistema permite eliminar con un descriptor de carpeta (unlinkat),
+# el kernel resuelve la ruta una sola vez por carpeta en vez de una vez
+# por archivo.
+_HAS_DIR_FD = os.unlink in os.supports_dir_fd
+
+# posix_fadvise no existe en todas las plataformas (p. ej. Windows).
+_HAS_FADVISE = hasattr(os, 'posix_fadvise')
+
+# Caché entre ejecuciones: carpetas que no contenían ningún archivo temporal,
+# identificadas por su mtime. En la siguiente ejecución, si el mtime no ha
+# cambiado, la carpeta se salta entera (el contenido no puede haber cambiado
+# de nombre sin tocar el mtime) y solo se visitan sus subcarpetas.
+CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'cleantmp', 'scan.db')
+
+# Lo activa clean_temp_files en modo recursivo salvo que se pida --no-cache.
+_cache_enabled = False
+
+_cache_lock = threading.Lock()
+
+# {ruta bytes: (mtime, [subcarpetas bytes])} leído del disco al empezar.
+_scan_cache = {}
+
+# Cambios pendientes de escribir: (mtime, subcarpetas) o None para invalidar.
+_cache_updates = {}
+
+# Los nombres se comparan como bytes: el recorrido trabaja con rutas bytes
+# (ver clean_temp_files) para ahorrarse la codificación a UTF-8 que cada
+# syscall repite con rutas str.
+TEMP_FILES = frozenset({
+    b".DS_Store",
+    b"Thumbs.db",
+    b"ehthumbs.db",
+    b"Desktop.ini"
+    })
 
 FILES_PATTERNS = [
     "._*",      # macOS metadata on non-HFS filesystems
     "*~",       # Backups (ej. archivo.txt~)
     ".*.sw?"    # Vim swap files (.file.swp, .file.swo, etc.)
 ]
+# Nota: si se añade un patrón, revisar también las anclas rápidas de
+# is_temp_file, que asumen esta lista.
 
-DIRS_TO_IGNORE = [
-    ".Spotlight-V100",
-    ".fseventsd",
-    ".Trash",
-    ".Trashes",
-    "$RECYCLE.BIN",
-    "System Volume Information",
-]
+# Patrones compilados una sola vez en una única expresión regular (sobre
+# bytes, como los nombres que entrega scandir); lo construye _init_matchers
+# antes de empezar el recorrido.
+_PATTERN_RE = None
+
+# Autómata Hyperscan (dependencia opcional); también lo prepara
+# _init_matchers si el paquete está disponible.
+hyperscan = None
+_HS_DB = None
+
+# Hyperscan exige un scratch por hilo que escanea; cada hilo del pool se
+# crea el suyo de forma perezosa.
+_hs_local = threading.local()
+
+DIRS_TO_IGNORE = frozenset({
+    b".Spotlight-V100",
+    b".fseventsd",
+    b".Trash",
+    b".Trashes",
+    b"$RECYCLE.BIN",
+    b"System Volume Information",
+})
 
 
 class CleanTmpException(Exception):
@@ -81,6 +145,7 @@ def def_handler(sig:int, frame:Optional[FrameType]) -> None:
         frame (FrameType): Marco de pila en el momento de la interrupción.
     """
     print(f"\n\n{colors['error']}[!] Saliendo...{colors['reset']}\n")
+    sys.stdout.flush()
     sys.exit(1)
 
 
@@ -91,132 +156,482 @@ def config_argparse() -> argparse.Namespace:
         argparse.Namespace: Objeto con los argumentos de línea de comandos parseados:
             - path (str): Ruta a la carpeta a limpiar (por defecto, la actual).
             - recursive (bool): Si se deben eliminar archivos de forma recursiva.
+            - no_cache (bool): Si se debe ignorar la caché de ejecuciones anteriores.
             - version (str): Muestra la versión y termina el programa.
     """
     parser = argparse.ArgumentParser(description = 'CleanTMP - Elimina archivos temporales del sistema')
     parser.add_argument('-r', '--recursive', action='store_true', help='Elimina archivos temporales de forma recursiva en carpetas')
+    parser.add_argument('--no-cache', action='store_true', help='Vuelve a examinar todas las carpetas aunque no hayan cambiado desde la última ejecución')
     parser.add_argument('path', nargs='?', default='.', type=str, help='Ruta a la carpeta a limpiar')
     parser.add_argument('-v', '--version', action='version', version=f'CleanTMP v1.1', help=f'Versión de CleanTMP')
     
     return parser.parse_args()
 
 
-def is_temp_file(filename:str) -> bool:
-    """Devuelve True si el archivo es considerado temporal.
+def _init_matchers() -> None:
+    """Prepara las estructuras de matching de is_temp_file.
+
+    Se llama una sola vez (desde el hilo principal) antes de empezar el
+    recorrido; así las importaciones pesadas no penalizan -v/-h y el bucle
+    caliente no necesita comprobaciones perezosas.
+    """
+    global _PATTERN_RE, _HS_DB, hyperscan
+
+    if _PATTERN_RE is not None:
+        return
+
+    import fnmatch
+    import re
+
+    _PATTERN_RE = re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in FILES_PATTERNS).encode())
+
+    # Hyperscan compila todos los patrones en un único autómata SIMD,
+    # interesante al examinar millones de nombres. Si el paquete no está
+    # instalado o el autómata no compila, se queda la regex de arriba.
+    try:
+        import hyperscan
+    except ImportError:
+        return
+
+    try:
+        db = hyperscan.Database()
+        # El '^' ancla el patrón al inicio del nombre, igual que hace
+        # _PATTERN_RE.match.
+        db.compile(
+            expressions=[("^" + fnmatch.translate(p)).encode() for p in FILES_PATTERNS],
+            ids=list(range(len(FILES_PATTERNS))),
+            elements=len(FILES_PATTERNS),
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(FILES_PATTERNS),
+        )
+    except hyperscan.error:
+        return
+
+    _HS_DB = db
+
+
+def _hs_on_match(id:int, start:int, end:int, flags:int, context=None) -> int:
+    """Callback de Hyperscan: detiene el escaneo en cuanto casa un patrón.
+
+    Returns:
+        int: Distinto de cero para terminar el escaneo (ScanTerminated).
+    """
+    return 1
+
+
+def _hs_match(filename:bytes) -> bool:
+    """Comprueba el nombre contra el autómata Hyperscan.
 
     Args:
-        filename (str): Nombre del archivo a comprobar.
-    
+        filename (bytes): Nombre del archivo a comprobar.
+
     Returns:
-        bool: True si es un archivo a eliminar, False en caso contrario.
+        bool: True si algún patrón de FILES_PATTERNS casa con el nombre.
     """
-    if filename in TEMP_FILES:
+    try:
+        scratch = _hs_local.scratch
+    except AttributeError:
+        scratch = hyperscan.Scratch(_HS_DB)
+        _hs_local.scratch = scratch
+
+    try:
+        _HS_DB.scan(filename, match_event_handler=_hs_on_match, scratch=scratch)
+    except hyperscan.ScanTerminated:
         return True
-    
-    for pattern in FILES_PATTERNS:
-        if fnmatch.fnmatch(filename, pattern):
-            return True
-        
+
     return False
 
 
-def is_access(path:str) -> bool:
-    """Si se tiene acceso a una carpeta o a un archivo.
+def is_temp_file(filename:bytes) -> bool:
+    """Devuelve True si el archivo es considerado temporal.
 
     Args:
-        path (str): Path con la ruta de la carpeta o archivo a comprobar.
-    
+        filename (bytes): Nombre del archivo a comprobar, tal y como lo entrega scandir sobre rutas bytes.
+
     Returns:
-        bool: True si se tiene acceso, False en caso contrario.
+        bool: True si es un archivo a eliminar, False en caso contrario.
     """
-    if os.path.isdir(path):
-        return os.access(path, os.R_OK) and os.access(path, os.X_OK)
-    else:
-        return os.access(path, os.R_OK) and os.access(path, os.W_OK)
+    if filename in TEMP_FILES:
+        return True
 
+    # Anclas estáticas de FILES_PATTERNS: '._*' y '*~' se resuelven con una
+    # comparación de prefijo/sufijo, y solo los nombres que empiezan por '.'
+    # pueden casar con '.*.sw?'. El caso común (ningún patrón casa) se
+    # descarta sin llegar a ejecutar la regex.
+    if filename.startswith(b"._") or filename.endswith(b"~"):
+        return True
+
+    if filename.startswith(b"."):
+        if _HS_DB is not None:
+            return _hs_match(filename)
+
+        return _PATTERN_RE.match(filename) is not None
+
+    return False
+
+
+def report(recursive:bool) -> Iterator[str]:
+    """Genera el reporte con el resultado de la eliminación.
 
-def report(recursive:bool) -> str:
-    """Reporte con el resultado de la eliminación.
-    
     Args:
         recursive (bool): Si la eliminación de archivos fue de forma recursiva.
-        
-    Returns:
-        str: Reporte final.
+
+    Yields:
+        str: Cada línea del reporte, coloreada y con los valores alineados.
     """
-    lines = []
+    # (color, etiqueta, valor, sangría); None marca una línea en blanco.
+    rows = []
 
     if recursive:
-        lines.append(f"\n{colors['examined']}Carpetas examinadas:{colors['reset']} {stats['examined_dirs']}")
+        rows.append(None)
+        rows.append(('examined', "Carpetas examinadas:", stats['examined_dirs'], ""))
 
         if stats['ignored_dirs'] > 0:
-            lines.append(f"  {colors['ignored']}Carpetas ignoradas:{colors['reset']}  {stats['ignored_dirs']}")
+            rows.append(('ignored', "Carpetas ignoradas:", stats['ignored_dirs'], "  "))
 
         if stats['inaccessible_dirs'] > 0:
-            lines.append(f"  {colors['no_access']}Carpetas sin acceso:{colors['reset']} {stats['inaccessible_dirs']}\n")
+            rows.append(('no_access', "Carpetas sin acceso:", stats['inaccessible_dirs'], "  "))
+            rows.append(None)
 
-    lines.append(f"{colors['examined']}Archivos examinados:{colors['reset']} {stats['examined_files']}")
-    lines.append(f"  {colors['eliminated']}Archivos eliminados:{colors['reset']} {stats['deleted_files']}")
+    rows.append(('examined', "Archivos examinados:", stats['examined_files'], ""))
+    rows.append(('eliminated', "Archivos eliminados:", stats['deleted_files'], "  "))
 
     if stats['inaccessible_files'] > 0:
-        lines.append(f"  {colors['no_access']}Archivos sin acceso:{colors['reset']} {stats['inaccessible_files']}")
+        rows.append(('no_access', "Archivos sin acceso:", stats['inaccessible_files'], "  "))
+
+    # El ancho se calcula una sola vez sobre las etiquetas presentes, de modo
+    # que los valores queden alineados también si se añaden contadores nuevos.
+    width = max(len(row[3]) + len(row[1]) for row in rows if row is not None)
+
+    for row in rows:
+        if row is None:
+            yield ""
+            continue
 
-    return "\n".join(lines)
+        color, label, value, indent = row
+        pad = " " * (width - len(indent) - len(label) + 1)
 
+        yield f"{indent}{colors[color]}{label}{colors['reset']}{pad}{value}"
 
-def clean_temp_files(path:str, recursive:bool = False) -> None:
+
+def _load_cache() -> None:
+    """Carga en memoria la caché de carpetas sin archivos temporales.
+
+    Cualquier problema con la base de datos deja la caché vacía; la
+    limpieza funciona igual, solo que sin el atajo.
+    """
+    import sqlite3
+
+    try:
+        con = sqlite3.connect(CACHE_FILE)
+
+        try:
+            rows = con.execute("SELECT path, mtime, subdirs FROM dirs").fetchall()
+        finally:
+            con.close()
+    except sqlite3.OperationalError:
+        # Base de datos recién creada o sin la tabla todavía.
+        return
+    except sqlite3.Error:
+        # Archivo corrupto: se descarta para que _save_cache lo regenere.
+        try:
+            os.remove(CACHE_FILE)
+        except OSError:
+            pass
+
+        return
+
+    for path, mtime, subdirs in rows:
+        if not isinstance(path, bytes):
+            # Fila TEXT de una versión anterior del esquema; se ignora y
+            # _save_cache la purga.
+            continue
+
+        subs = subdirs.split(b"\x00") if subdirs else []
+        _scan_cache[path] = (mtime, subs)
+
+
+def _save_cache() -> None:
+    """Escribe en disco los cambios acumulados durante la ejecución.
+
+    Se llama una única vez al terminar el recorrido, desde el hilo
+    principal; los errores de escritura se ignoran (la caché es solo un
+    atajo).
+    """
+    if not _cache_updates:
+        return
+
+    import sqlite3
+
+    try:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+
+        con = sqlite3.connect(CACHE_FILE)
+
+        try:
+            # Las rutas se guardan como BLOB, byte a byte: pasarlas por
+            # os.fsdecode rompía con nombres que no son UTF-8 válido
+            # (sqlite no acepta los subrogados resultantes).
+            con.execute("CREATE TABLE IF NOT EXISTS dirs ("
+                        "path BLOB PRIMARY KEY, mtime REAL, subdirs BLOB)")
+
+            # Purga las filas TEXT de versiones anteriores del esquema.
+            con.execute("DELETE FROM dirs WHERE typeof(path) = 'text'")
+
+            for path, value in _cache_updates.items():
+                if value is None:
+                    con.execute("DELETE FROM dirs WHERE path = ?", (path,))
+                else:
+                    mtime, subs = value
+                    con.execute("INSERT OR REPLACE INTO dirs VALUES (?, ?, ?)",
+                                (path, mtime, b"\x00".join(subs)))
+
+            con.commit()
+        finally:
+            con.close()
+    except (OSError, sqlite3.Error):
+        pass
+
+
+def _clean_dir(path:bytes, recursive:bool = False) -> list:
+    """Examina una única carpeta y elimina sus archivos temporales.
+
+    Args:
+        path (bytes): Ruta de la carpeta a examinar, codificada con os.fsencode.
+        recursive (bool): Si la eliminación se hará de forma recursiva.
+
+    Returns:
+        list: Rutas (bytes) de las subcarpetas pendientes de examinar.
+
+    Raises:
+        CleanTmpException: Si no se puede acceder a la carpeta o está vacía (solo en modo no recursivo).
+    """
+    with _stats_lock:
+        stats['examined_dirs'] += 1
+
+    # El mtime se toma ANTES de escanear: cualquier cambio concurrente en la
+    # carpeta lo adelanta y la entrada de caché queda invalidada sola.
+    mtime = None
+
+    if _cache_enabled:
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            pass
+
+        if mtime is not None:
+            cached = _scan_cache.get(path)
+
+            if cached is not None and cached[0] == mtime:
+                # La carpeta no tenía archivos temporales y no ha cambiado:
+                # se salta su contenido y se sigue por las subcarpetas.
+                return list(cached[1])
+
+    # Mejor pedir perdón que permiso: scandir ya comprueba el acceso, así
+    # que los dos access() previos que hacía is_access() sobraban.
+    try:
+        it = os.scandir(path)
+    except PermissionError:
+        if recursive:
+            with _stats_lock:
+                stats['inaccessible_dirs'] += 1
+            return []
+        else:
+            raise CleanTmpException(f"No se puede acceder a la carpeta {os.fsdecode(path)}")
+    except OSError:
+        # Carpeta desaparecida a mitad de ejecución (u obsoleta en la lista
+        # de subcarpetas de la caché): en modo recursivo se contabiliza y se
+        # continúa en vez de abortar todo el recorrido.
+        if recursive:
+            with _stats_lock:
+                stats['inaccessible_dirs'] += 1
+            return []
+
+        raise
+
+    subdirs = []
+
+    # Candidatos a eliminar de esta carpeta; se recogen en una pasada y se
+    # eliminan después en lote.
+    temp_entries = []
+
+    # Contadores locales del bucle caliente; se vuelcan a stats con una
+    # única adquisición del lock al terminar la carpeta.
+    examined = deleted = inaccessible = ignored = 0
+
+    # Nombres globales del bucle enlazados a locales (LOAD_FAST): es el
+    # recorte de coste de intérprete disponible sin salir de Python puro.
+    _is_temp = is_temp_file
+    _ignore = DIRS_TO_IGNORE
+
+    empty = True
+
+    try:
+        # Las entradas se consumen en streaming según las entrega getdents:
+        # solo se retienen las subcarpetas y los candidatos a eliminar, no
+        # un DirEntry por cada archivo de la carpeta.
+        with it:
+            for entry in it:
+                empty = False
+
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        if entry.name in _ignore:
+                            ignored += 1
+                            continue
+
+                        subdirs.append(entry.path)
+
+                    continue
+
+                examined += 1
+
+                if entry.is_file(follow_symlinks=False) and _is_temp(entry.name):
+                    temp_entries.append(entry)
+
+        if empty and not recursive:
+            raise CleanTmpException(f"La carpeta está vacía: {os.fsdecode(path)}")
+
+        if temp_entries:
+            # Eliminar por orden de inodo (ya viene cacheado de getdents,
+            # no cuesta ningún stat) reduce los saltos por la tabla de
+            # inodos y agrupa mejor las escrituras del journal.
+            temp_entries.sort(key=lambda e: e.inode())
+
+            # Descriptor de la carpeta para eliminar por nombre; -1 si no
+            # se pudo abrir o el sistema no lo soporta.
+            dir_fd = -1
+
+            if _HAS_DIR_FD:
+                try:
+                    dir_fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+                except OSError:
+                    pass
+
+            _unlink = os.unlink
+            _remove = os.remove
+
+            try:
+                for entry in temp_entries:
+                    try:
+                        if dir_fd != -1:
+                            _unlink(entry.name, dir_fd=dir_fd)
+                        else:
+                            _remove(entry.path)
+
+                        deleted += 1
+                    except OSError:
+                        print(_MSG_DELETE_ERROR + os.fsdecode(entry.path))
+                        inaccessible += 1
+            finally:
+                if dir_fd != -1:
+                    # Los bloques de esta carpeta no se vuelven a leer; se
+                    # avisa al kernel de que puede descartar sus páginas
+                    # para no desplazar datos útiles de la caché.
+                    if _HAS_FADVISE:
+                        try:
+                            os.posix_fadvise(dir_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                        except OSError:
+                            pass
+
+                    os.close(dir_fd)
+    finally:
+        with _stats_lock:
+            stats['examined_files'] += examined
+            stats['deleted_files'] += deleted
+            stats['inaccessible_files'] += inaccessible
+            stats['ignored_dirs'] += ignored
+
+    if _cache_enabled and mtime is not None:
+        with _cache_lock:
+            if temp_entries:
+                # Hubo archivos temporales (eliminados o no): la entrada
+                # antigua ya no vale.
+                _cache_updates[path] = None
+            else:
+                _cache_updates[path] = (mtime, subdirs)
+
+    return subdirs
+
+
+def _clean_branch(path:bytes) -> list:
+    """Procesa una carpeta y, si tiene pocas subcarpetas, también sus descendientes en el mismo hilo.
+
+    Args:
+        path (bytes): Ruta de la carpeta raíz de la rama.
+
+    Returns:
+        list: Rutas (bytes) de las subcarpetas que conviene repartir entre los hilos del pool.
+    """
+    local = deque([path])
+    pending = []
+
+    while local:
+        subdirs = _clean_dir(local.popleft(), True)
+
+        if len(subdirs) > _FANOUT_THRESHOLD:
+            pending.extend(subdirs)
+        else:
+            local.extend(subdirs)
+
+    return pending
+
+
+def clean_temp_files(path:str, recursive:bool = False, use_cache:bool = True) -> None:
     """Función principal para la eliminación de archivos temporales.
-    
+
     Args:
         path (str): Ruta a examinar.
         recursive (bool): Si la eliminación se hará de forma recursiva.
+        use_cache (bool): Si se puede reutilizar la caché de carpetas sin
+            archivos temporales de ejecuciones anteriores (solo modo recursivo).
 
     Raises:
         CleanTmpException: Si se ha producido un error en el escaneo o eliminación de archivos temporales.
     """
     if not os.path.exists(path) or not os.path.isdir(path):
         raise CleanTmpException(f"No se ha podido obtener una ruta válida")
-    
-    stats['examined_dirs'] += 1
 
-    if not is_access(path):
-        if recursive:
-            stats['inaccessible_dirs'] += 1
-            return
-        else:
-            raise CleanTmpException(f"No se puede acceder a la carpeta {path}")
+    # La ruta se normaliza a absoluta para que la caché no mezcle entradas
+    # de invocaciones relativas ('cleantmp -r .') hechas desde carpetas
+    # distintas, y el recorrido trabaja con rutas bytes: scandir devuelve
+    # entonces nombres bytes y las syscalls posteriores (unlink, open) no
+    # tienen que volver a codificar la ruta en cada llamada.
+    path = os.fsencode(os.path.abspath(path))
 
-    file_list = os.listdir(path)
-    
-    if len(file_list) == 0 and not recursive:
-        raise CleanTmpException(f"La carpeta está vacía: {path}")
-    
-    for file in file_list:
-        filepath = os.path.join(path, file)
-        if os.path.isdir(filepath):
-            if recursive:
-                if file in DIRS_TO_IGNORE:
-                    stats['ignored_dirs'] += 1
-                    continue
+    _init_matchers()
 
-                clean_temp_files(filepath, recursive)
+    global _cache_enabled
+    _cache_enabled = recursive and use_cache
 
-            continue
+    if _cache_enabled:
+        _load_cache()
 
-        stats['examined_files'] += 1
-        
-        if is_temp_file(file):
-            if not is_access(filepath):
-                print(f"{colors['error']}[!] No se ha podido eliminar el archivo:{colors['reset']} {filepath}")
-                stats['inaccessible_files'] += 1
-                continue
-            
-            try:
-                os.remove(filepath)
-                stats['deleted_files'] += 1
-            except Exception:
-                print(f"{colors['error']}[!] No se ha podido eliminar el archivo:{colors['reset']} {filepath}")
-                stats['inaccessible_files'] += 1
+    if not recursive:
+        _clean_dir(path, recursive)
+        return
+
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    pool = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    pending = {pool.submit(_clean_branch, path)}
+
+    try:
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                for subdir in future.result():
+                    pending.add(pool.submit(_clean_branch, subdir))
+    finally:
+        # Al salir (también con Ctrl + C) se cancelan las carpetas aún no
+        # empezadas para no retrasar la terminación del programa.
+        for future in pending:
+            future.cancel()
+
+        pool.shutdown(wait=True)
+
+        if _cache_enabled:
+            _save_cache()
 
 
 def main() -> None:
@@ -228,14 +643,27 @@ def main() -> None:
     """
     parser = config_argparse()
 
+    # En un terminal stdout va en modo línea y cada print del bucle de
+    # eliminación paga una llamada write(); con el búfer en bloque los
+    # mensajes se agrupan y se vacían una sola vez al terminar.
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+
     try:
-        clean_temp_files(parser.path, parser.recursive)
+        clean_temp_files(parser.path, parser.recursive, not parser.no_cache)
+
+        # El reporte se escribe en streaming, línea a línea, sin construir
+        # la cadena completa.
+        out = sys.stdout.write
 
-        print(report(parser.recursive))
+        for line in report(parser.recursive):
+            out(line + "\n")
     except CleanTmpException as ex:
         print(f"\n{colors['error']}[!] {str(ex)}{colors['reset']}\n")
     except Exception as ex:
         print(f"\n{colors['error']}[!] Se ha producido un error inesperado:{colors['reset']} {str(ex)}\n")
+    finally:
+        sys.stdout.flush()
 
 
 if __name__ == '__main__':